@@ -11,7 +11,7 @@ import urllib.error
 import urllib.parse
 import tkinter.font as tkfont
 
-from ui_layout import create_layout, TooltipManager, CUSTOM_FONT_NAME, EXPLORER_PANEL_WIDTH
+from ui_layout import create_layout, relocalize, debounce_sliders, TooltipManager, CUSTOM_FONT_NAME, EXPLORER_PANEL_WIDTH
 from audio_player import AudioPlayer
 from file_explorer import FileExplorer
 from vocal_separator import SidecarClient, get_recommended_model
@@ -693,6 +693,14 @@ def main():
 
     # Tooltips
     main_tooltip_manager = TooltipManager(window)
+    try:
+        main_tooltip_manager.prewarm()
+    except Exception:
+        pass
+    try:
+        debounce_sliders(window)
+    except Exception:
+        pass
     # Bind info tooltips with translated text
     main_tooltip_manager.bind(window['-INFO1-'].Widget, i18n.t('headphone_info_tooltip'))
     main_tooltip_manager.bind(window['-INFO2-'].Widget, i18n.t('virtual_info_tooltip'))
@@ -1310,47 +1318,6 @@ def main():
     # --------------------------- main event loop --------------------------
     current_stage_token = "Preparing"  # track stage for progress mapping
 
-    # Map UI keys to translation keys for dynamic updates
-    ui_translation_map = {
-        'file_explorer_title': 'file_explorer_title',
-        '-FOLDER_PATH-': 'folder_path_placeholder',
-        '-BACK-': 'back_button',
-        '-CHANGE_FOLDER-': 'change_folder_button',
-        '-OPEN_FOLDER-': 'open_folder_button',
-        '-REFRESH-': 'refresh_button',
-        'vocal_separator_title': 'vocal_separator_title',
-        '-YT_MODE-': 'ui.youtube.toggle',
-        '-YT_LABEL-': 'ui.youtube.toggle',
-        '-SEP_GPU_STATUS-': 'gpu_status_checking',
-        'song_file_label': 'song_file_label',
-        '-YT_URL_LABEL-': 'ui.youtube.url_label',
-        '-SONG_FILE_BROWSE-': 'browse_file_button',
-        '-START_SEPARATION-': 'start_separation_button',
-        '-YT_DL_ONLY-': 'ui.youtube.fetch_only',
-        '-YT_DL_SEP-': 'ui.youtube.fetch_and_sep',
-        '-OPEN_SEPARATOR_SETTINGS-': 'separator_settings_button',
-        '-SEPARATOR_STATUS-': 'separator_status_ready',
-        'audio_loader_title': 'audio_loader_title',
-        'instrumental_label': 'instrumental_label',
-        'vocal_label': 'vocal_label',
-        'headphone_label': 'headphone_label',
-        'virtual_label': 'virtual_label',
-        'sample_rate_label': 'sample_rate_label',
-        'hz_label': 'hz_label',
-        '-REFRESH_DEVICES-': 'refresh_devices_button',
-        'normalize_label': 'normalize_label',
-        'lufs_label': 'lufs_label',
-        'pitch_label': 'pitch_label',
-        '-LOAD-': 'load_audio_button',
-        'player_title': 'player_title',
-        '-REWIND-': 'rewind_button',
-        '-PLAY_PAUSE-': 'play_button',
-        '-FORWARD-': 'forward_button',
-        '-STOP-': 'stop_button',
-        'instrumental_volume_label': 'instrumental_volume_label',
-        'vocal_volume_label': 'vocal_volume_label'
-    }
-
     def apply_translations():
         """Update UI text values to reflect the current language."""
         # Update window title
@@ -1362,25 +1329,11 @@ def main():
             )
         except Exception:
             pass
-        # Update static widgets
-        for widget_key, trans_key in ui_translation_map.items():
-            try:
-                if widget_key in window.AllKeysDict:
-                    # Special handling for buttons with dynamic text such as PLAY/PAUSE
-                    if widget_key == '-START_SEPARATION-':
-                        # Determine correct label based on separation state
-                        text_key = 'stop_separation_button' if separating else 'start_separation_button'
-                        window[widget_key].update(i18n.t(text_key))
-                    elif widget_key == '-PLAY_PAUSE-':
-                        # Determine Play/Pause text based on playing state
-                        text_key = 'pause_button' if player.playing else 'play_button'
-                        window[widget_key].update(i18n.t(text_key))
-                    elif widget_key == '-YT_MODE-':
-                        window[widget_key].update(text=i18n.t(trans_key))
-                    else:
-                        window[widget_key].update(i18n.t(trans_key))
-            except Exception:
-                pass
+        # Update static widgets; Start/Stop and Play/Pause follow current state
+        relocalize(window, i18n.t, {
+            '-START_SEPARATION-': 'stop_separation_button' if separating else 'start_separation_button',
+            '-PLAY_PAUSE-': 'pause_button' if player.playing else 'play_button',
+        })
         # Update tooltips
         main_tooltip_manager.bind(window['-INFO1-'].Widget, i18n.t('headphone_info_tooltip'))
         main_tooltip_manager.bind(window['-INFO2-'].Widget, i18n.t('virtual_info_tooltip'))
@@ -1,6 +1,7 @@
 from __future__ import annotations
-import sys, os, json, time, threading, traceback, urllib.request, subprocess, shlex, re
-from typing import Any, Dict, List, Optional, Tuple
+import sys, os, json, time, threading, traceback, urllib.request, subprocess, shlex, re, functools, queue, platform
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
 # ----- Force UTF-8 stdio (avoid Windows cp1252 issues) -----
@@ -24,6 +25,7 @@ def _app_root() -> Path:
         return Path(sys._MEIPASS)
     return Path(__file__).resolve().parent
 
+@functools.lru_cache(maxsize=2)  # venv layout is fixed for the sidecar's lifetime
 def _find_sidecar_python(want_gpu: bool) -> str:
     base = _app_root()
     # Put the most likely names first. You said CPU build puts the venv as "sidecar_venv"
@@ -60,111 +62,250 @@ CANDIDATE_MANIFEST_URLS = [
 ]
 
 _out_lock = threading.Lock()
+_ENCODE = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+# stage -> (monotonic time, pct) of the last progress event actually emitted
+_last_progress: Dict[str, Tuple[float, Any]] = {}
+_PROGRESS_DEDUP_WINDOW = 0.05
+
+# Producers only enqueue encoded lines; a single writer thread owns stdout.
+# A threading.Event on the queue is a flush marker (see flush_events).
+_EVQ = queue.SimpleQueue()
+
+def _write_stdout(data: bytes) -> None:
+    try:
+        out = getattr(sys.stdout, "buffer", None)
+        if out is not None:
+            out.write(data); out.flush()
+        else:
+            sys.stdout.write(data.decode("utf-8")); sys.stdout.flush()
+    except Exception as e:
+        try: sys.stderr.write(f"[SEP DEBUG] stdout write failure: {e}\n"); sys.stderr.flush()
+        except Exception: pass
+
+_WRITE_COALESCE_WINDOW = 0.010  # seconds; bursts within this window go out as one write
+
+def _event_writer() -> None:
+    while True:
+        item = _EVQ.get()
+        batch: List[bytes] = []; marker = None
+        deadline = time.monotonic() + _WRITE_COALESCE_WINDOW
+        while True:
+            if isinstance(item, threading.Event):
+                marker = item; break
+            batch.append(item)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0: break
+            try: item = _EVQ.get(timeout=remaining)
+            except queue.Empty: break
+        if batch: _write_stdout(b"".join(batch))
+        if marker is not None: marker.set()
+
+threading.Thread(target=_event_writer, name="event-writer", daemon=True).start()
+
+def flush_events(timeout: float = 2.0) -> None:
+    """Block until everything queued so far has been written to stdout."""
+    marker = threading.Event(); _EVQ.put(marker); marker.wait(timeout)
+
 def send_event(obj: Dict[str, Any]) -> None:
-    """Emit NDJSON to GUI (ASCII-escaped to be safe across consoles)."""
+    """Emit NDJSON to GUI (UTF-8 bytes queued for the stdout writer thread; the client decodes UTF-8)."""
+    if obj.get("type") == "progress":
+        # Drop repeats of the same (stage, pct) arriving within the dedup window
+        stage = str(obj.get("stage") or ""); pct = obj.get("pct"); now = time.monotonic()
+        with _out_lock:
+            prev = _last_progress.get(stage)
+            if prev and prev[1] == pct and (now - prev[0]) < _PROGRESS_DEDUP_WINDOW:
+                return
+            _last_progress[stage] = (now, pct)
     try:
-        line = json.dumps(obj, ensure_ascii=True, separators=(",", ":"))
+        line = _ENCODE(obj)
     except Exception as e:
         try: sys.stderr.write(f"[SEP DEBUG] JSON encode failure: {e}\n"); sys.stderr.flush()
         except Exception: pass
         return
-    with _out_lock:
-        try:
-            sys.stdout.write(line + "\n"); sys.stdout.flush()
-        except Exception as e:
-            try: sys.stderr.write(f"[SEP DEBUG] stdout write failure: {e}\n"); sys.stderr.flush()
-            except Exception: pass
+    _EVQ.put(line.encode("utf-8", errors="replace") + b"\n")
 
 def dbg(msg: str) -> None:
     try: sys.stderr.write(f"[SEP DEBUG] {msg}\n"); sys.stderr.flush()
     except Exception: pass
 
+# ---------------------- Lazy heavy imports ----------------------
+# torch / onnxruntime / audio_separator each cost 100-1000 ms to import on Windows.
+# Import on first use only, and cache the result (including failure -> None).
+
+@functools.lru_cache(maxsize=1)
+def _audio_separator():
+    try:
+        import audio_separator; return audio_separator
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _torch():
+    try:
+        import torch; return torch
+    except Exception:
+        return None
+
+@functools.lru_cache(maxsize=1)
+def _onnxruntime():
+    try:
+        import onnxruntime; return onnxruntime
+    except Exception:
+        return None
+
+# orjson is optional; stdlib json.loads also accepts bytes
+try:
+    import orjson
+    _LOADS = orjson.loads
+except ImportError:
+    _LOADS = json.loads
+
+# tqdm progress in child stderr, e.g. b" 42%|████..."
+_PCT_RE = re.compile(rb"(\d{1,3})%\|")
+_EOL_RE = re.compile(rb"\r\n?|\n")
+
+def _iter_raw_lines(stream) -> Iterator[bytes]:
+    """Yield byte lines split on CR or LF (tqdm refreshes in place with bare CR)."""
+    read = getattr(stream, "read1", None) or stream.read
+    buf = b""
+    while True:
+        chunk = read(65536)
+        if not chunk: break
+        buf += chunk
+        start = 0
+        for m in _EOL_RE.finditer(buf):
+            yield buf[start:m.end()]; start = m.end()
+        buf = buf[start:]
+    if buf: yield buf
+
 # Map zh stage -> GUI stage key (used by client to compute overall %)
+_STAGE_KEY = {
+    STAGE_DL:   "DownloadingModel",
+    STAGE_LOAD: "LoadingModel",
+    STAGE_SEP:  "Separation",
+    STAGE_SAVE: "Finalize",
+    STAGE_READY:"Finalize",  # when bouncing back to ready after work/cancel
+}
 def _stage_key_from_zh(zh: str) -> str:
-    mapping = {
-        STAGE_DL:   "DownloadingModel",
-        STAGE_LOAD: "LoadingModel",
-        STAGE_SEP:  "Separation",
-        STAGE_SAVE: "Finalize",
-        STAGE_READY:"Finalize",  # when bouncing back to ready after work/cancel
-    }
-    return mapping.get(zh, zh or "")
+    return _STAGE_KEY.get(zh, zh or "")
 
 # ---------------------- Model listing (unchanged logic) ----------------------
 
+def _fetch_manifest_one(url: str) -> Dict[str, Dict[str, Any]]:
+    req = urllib.request.Request(url, headers={"User-Agent": "KHelperV2/1.0"})
+    with urllib.request.urlopen(req, timeout=12) as resp:
+        if resp.status != 200:
+            raise RuntimeError(f"HTTP {resp.status}")
+        raw = resp.read()
+    try: data = json.loads(raw)
+    except Exception: data = json.loads(raw.decode("utf-8", errors="ignore"))
+    normalized: Dict[str, Dict[str, Any]] = {}
+    if not isinstance(data, (dict, list)): return normalized
+    items = list(data.items()) if isinstance(data, dict) else []
+    if isinstance(data, list):
+        for it in data:
+            if isinstance(it, dict):
+                fn = it.get("filename") or it.get("file") or it.get("name")
+                if fn: items.append((fn, it))
+    for k, v in items:
+        if not isinstance(v, dict): continue
+        fname = str(k).strip()
+        if not fname: continue
+        normalized[fname] = {
+            "url": v.get("url") or v.get("download_url") or v.get("hf_url"),
+            "sha256": v.get("sha256") or v.get("sha256sum"),
+            "size": v.get("size"),
+            "family": v.get("family"),
+            "friendly_name": v.get("friendly_name") or v.get("label") or fname,
+        }
+    return normalized
+
+def _probe_manifest(idx: int, url: str, results: "queue.SimpleQueue") -> None:
+    try: results.put((idx, _fetch_manifest_one(url), None))
+    except Exception as e: results.put((idx, None, str(e)))
+
 def fetch_remote_manifest() -> Dict[str, Dict[str, Any]]:
+    # Probe all mirrors concurrently but keep list priority: mirror i wins only once every
+    # mirror before it has failed or come back empty. Daemon threads, so probes abandoned
+    # after a winner can't hold up interpreter exit.
     last_err = None
-    for url in CANDIDATE_MANIFEST_URLS:
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "KHelperV2/1.0"})
-            with urllib.request.urlopen(req, timeout=12) as resp:
-                if resp.status != 200:
-                    last_err = f"HTTP {resp.status}"; continue
-                raw = resp.read()
-                try: data = json.loads(raw)
-                except Exception: data = json.loads(raw.decode("utf-8", errors="ignore"))
-                if not isinstance(data, (dict, list)): continue
-                normalized: Dict[str, Dict[str, Any]] = {}
-                items = data.items() if isinstance(data, dict) else []
-                if isinstance(data, list):
-                    for it in data:
-                        if isinstance(it, dict):
-                            fn = it.get("filename") or it.get("file") or it.get("name")
-                            if fn: items.append((fn, it))
-                for k, v in items:
-                    if not isinstance(v, dict): continue
-                    fname = str(k).strip()
-                    if not fname: continue
-                    normalized[fname] = {
-                        "url": v.get("url") or v.get("download_url") or v.get("hf_url"),
-                        "sha256": v.get("sha256") or v.get("sha256sum"),
-                        "size": v.get("size"),
-                        "family": v.get("family"),
-                        "friendly_name": v.get("friendly_name") or v.get("label") or fname,
-                    }
-                if normalized:
-                    dbg(f"Remote manifest loaded from {url} with {len(normalized)} entries")
-                    return normalized
-        except Exception as e:
-            last_err = str(e); continue
+    urls = CANDIDATE_MANIFEST_URLS
+    results: "queue.SimpleQueue" = queue.SimpleQueue()
+    for i, url in enumerate(urls):
+        threading.Thread(target=_probe_manifest, args=(i, url, results), name="manifest-probe", daemon=True).start()
+    done: Dict[int, Optional[Dict[str, Dict[str, Any]]]] = {}
+    nxt = 0
+    while nxt < len(urls):
+        i, normalized, err = results.get()
+        if err is not None: last_err = err
+        done[i] = normalized
+        while nxt in done:
+            normalized = done.pop(nxt)
+            if normalized:
+                dbg(f"Remote manifest loaded from {urls[nxt]} with {len(normalized)} entries")
+                return normalized
+            nxt += 1
     dbg(f"Remote manifest not available ({last_err}).")
     return {}
 
+# fname -> ((mtime, size), parsed json); avoids re-parsing package metadata on every list_models
+_PKG_MODELS_CACHE: Dict[str, Tuple[Optional[Tuple[float, int]], Any]] = {}
+
+def _load_packaged_json(ir, pkg, fname: str) -> Any:
+    if not hasattr(ir, "files"):
+        cached = _PKG_MODELS_CACHE.get(fname)
+        if cached is not None: return cached[1]
+        with ir.open_text("audio_separator", fname, encoding="utf-8") as f: data=json.load(f)
+        _PKG_MODELS_CACHE[fname] = (None, data)
+        return data
+    p = ir.files(pkg) / fname
+    try:
+        st = os.stat(p)  # Traversable is a real path for regular installs
+        sig: Optional[Tuple[float, int]] = (st.st_mtime, st.st_size)
+    except Exception:
+        sig = None
+    cached = _PKG_MODELS_CACHE.get(fname)
+    if cached is not None and cached[0] == sig:
+        return cached[1]
+    data=None
+    if p.is_file():
+        with p.open("r", encoding="utf-8") as f: data=json.load(f)
+    _PKG_MODELS_CACHE[fname] = (sig, data)
+    return data
+
 def read_packaged_models() -> List[Tuple[str, str]]:
-    out: List[Tuple[str, str]] = []; seen=set()
+    out: Dict[str, Tuple[str, str]] = {}  # fn.lower() -> (fn, friendly); dict keeps insertion order
     try:
         import importlib.resources as ir
-        import audio_separator
+        audio_separator = _audio_separator()
+        if audio_separator is None: raise ImportError("audio_separator unavailable")
         for fname in ("model-data.json", "models-scores.json"):
             try:
-                data=None
-                if hasattr(ir, "files"):
-                    p = ir.files(audio_separator) / fname
-                    if p.is_file():
-                        with p.open("r", encoding="utf-8") as f: data=json.load(f)
-                else:
-                    with ir.open_text("audio_separator", fname, encoding="utf-8") as f: data=json.load(f)
+                data=_load_packaged_json(ir, audio_separator, fname)
                 if not data: continue
                 if isinstance(data, dict):
                     if "models" in data and isinstance(data["models"], list):
                         for m in data["models"]:
                             fn=(m.get("filename") or "").strip()
                             fr=(m.get("friendly_name") or m.get("name") or fn).strip()
-                            if fn and fn.lower().endswith(".onnx") and fn.lower() not in seen:
-                                out.append((fn, fr or fn)); seen.add(fn.lower())
+                            k=fn.lower()
+                            if fn and k.endswith(".onnx") and k not in out:
+                                out[k]=(fn, fr or fn)
                     else:
                         for fn, m in data.items():
                             fr=(m.get("friendly_name") or m.get("name") or fn).strip() if isinstance(m, dict) else str(m)
                             sfn=str(fn)
-                            if sfn and sfn.lower().endswith(".onnx") and sfn.lower() not in seen:
-                                out.append((sfn, fr or sfn)); seen.add(sfn.lower())
+                            k=sfn.lower()
+                            if sfn and k.endswith(".onnx") and k not in out:
+                                out[k]=(sfn, fr or sfn)
                 elif isinstance(data, list):
                     for m in data:
                         if isinstance(m, dict):
                             fn=(m.get("filename") or m.get("Model Filename") or "").strip()
                             fr=(m.get("friendly_name") or m.get("Friendly Name") or fn).strip()
-                            if fn and fn.lower().endswith(".onnx") and fn.lower() not in seen:
-                                out.append((fn, fr or fn)); seen.add(fn.lower())
+                            k=fn.lower()
+                            if fn and k.endswith(".onnx") and k not in out:
+                                out[k]=(fn, fr or fn)
                 dbg(f"read_packaged_models: added from {fname}: {len(out)} total so far")
             except FileNotFoundError:
                 dbg(f"read_packaged_models: {fname} not found in package")
@@ -172,55 +313,68 @@ def read_packaged_models() -> List[Tuple[str, str]]:
                 dbg(f"read_packaged_models: failed to parse {fname}: {e}")
     except Exception as e:
         dbg(f"read_packaged_models: importlib.resources failed: {e}")
-    return out
+    return list(out.values())
+
+_RECOMMENDED_MODEL = "UVR-MDX-NET-Inst_HQ_5.onnx"
+_FALLBACK_MODELS: Tuple[Tuple[str, str], ...] = (
+    (_RECOMMENDED_MODEL,          "UVR MDX-NET Inst HQ 5 (recommended)"),
+    ("UVR-MDX-NET-Inst_HQ_4.onnx", "UVR MDX-NET Inst HQ 4"),
+    ("UVR_MDXNET_KARA_2.onnx",     "UVR MDXNET KARA 2"),
+)
 
 def list_models_combined() -> List[Dict[str, str]]:
-    out: List[Tuple[str, str]] = []; seen=set()
+    out: Dict[str, Tuple[str, str]] = {}  # fn.lower() -> (fn, friendly); dict keeps insertion order
     try:
-        for fn in os.listdir(MODELS_DIR):
-            if fn.lower().endswith(".onnx"):
-                out.append((fn, fn)); seen.add(fn.lower())
+        with os.scandir(MODELS_DIR) as it:
+            for e in it:
+                fn=e.name; k=fn.lower()
+                # .onnx suffix excludes .part leftovers from aborted downloads
+                if k.endswith(".onnx") and e.is_file():
+                    out[k]=(fn, fn)
         dbg(f"list_models: found {len(out)} local .onnx")
     except Exception as e:
         dbg(f"list_models: local scan failed: {e}")
     added_api=0
-    try:
-        from audio_separator.separator import Separator
-        sep=Separator()
-        if hasattr(sep, "list_models"):
-            api_list=sep.list_models()
-            for m in api_list or []:
-                filename=(m.get("model_filename") or m.get("Model Filename") or m.get("filename"))
-                friendly=m.get("Friendly Name") or m.get("friendly_name") or filename
-                if filename and filename.lower() not in seen:
-                    out.append((filename, friendly or filename)); seen.add(filename.lower()); added_api+=1
-        dbg(f"list_models: API added {added_api}, total {len(out)}")
-    except Exception as e:
-        dbg(f"list_models: API list failed: {e}")
+    # Instantiating Separator is slow; only ask the API when nothing is on disk (or explicitly requested)
+    if not out or os.environ.get("KHELPER_FULL_LIST") == "1":
+        try:
+            from audio_separator.separator import Separator
+            sep=Separator()
+            if hasattr(sep, "list_models"):
+                api_list=sep.list_models()
+                for m in api_list or []:
+                    filename=(m.get("model_filename") or m.get("Model Filename") or m.get("filename"))
+                    friendly=m.get("Friendly Name") or m.get("friendly_name") or filename
+                    if filename and filename.lower() not in out:
+                        out[filename.lower()]=(filename, friendly or filename); added_api+=1
+            dbg(f"list_models: API added {added_api}, total {len(out)}")
+        except Exception as e:
+            dbg(f"list_models: API list failed: {e}")
+    else:
+        dbg("list_models: local models present; skipping API list")
     try:
         pkg_models=read_packaged_models(); added=0
         for fn, fr in pkg_models:
-            if fn.lower() not in seen:
-                out.append((fn, fr or fn)); seen.add(fn.lower()); added+=1
+            k=fn.lower()
+            if k not in out:
+                out[k]=(fn, fr or fn); added+=1
         dbg(f"list_models: packaged metadata added {added}, total {len(out)}")
     except Exception as e:
         dbg(f"list_models: packaged metadata failed: {e}")
     try:
         manifest=fetch_remote_manifest(); added=0
         for fname, meta in manifest.items():
-            if fname and fname.lower().endswith(".onnx") and fname.lower() not in seen:
-                out.append((fname, meta.get("friendly_name") or fname)); seen.add(fname.lower()); added+=1
+            k=fname.lower()
+            if fname and k.endswith(".onnx") and k not in out:
+                out[k]=(fname, meta.get("friendly_name") or fname); added+=1
         dbg(f"list_models: manifest added {added}, total {len(out)}")
     except Exception as e:
         dbg(f"list_models: manifest failed: {e}")
-    if not out:
-        out=[("UVR-MDX-NET-Inst_HQ_5.onnx","UVR MDX-NET Inst HQ 5 (recommended)"),
-             ("UVR-MDX-NET-Inst_HQ_4.onnx","UVR MDX-NET Inst HQ 4"),
-             ("UVR_MDXNET_KARA_2.onnx","UVR MDXNET KARA 2")]
-    rec="UVR-MDX-NET-Inst_HQ_5.onnx"; enhanced=[]
-    for fn, fr in out:
+    models=list(out.values()) or _FALLBACK_MODELS
+    enhanced=[]
+    for fn, fr in models:
         name=fr or fn
-        if fn==rec and "(recommended)" not in (name or "").lower():
+        if fn==_RECOMMENDED_MODEL and "(recommended)" not in name.lower():
             name=f"{name} (recommended)"
         enhanced.append({"filename":fn,"name":name})
     return enhanced
@@ -298,6 +452,32 @@ def ensure_model_available(model_filename: str, model_file_dir: str, abort_evt:
     send_event({"type":"status","stage":STAGE_DL,"msg":f"下載 {model_filename}","stage_key":_stage_key_from_zh(STAGE_DL)})
     download_with_progress(entry["url"], local_path, abort_evt)
 
+# ---------------------- Capability probe cache ----------------------
+
+GPU_PROBE_PATH = os.path.join(APP_DATA_DIR, "gpu_probe.json")
+
+def _gpu_probe_key() -> List[str]:
+    # The probe result is only valid for the same interpreter on the same machine
+    return [sys.executable, platform.node()]
+
+def _read_gpu_probe_cache() -> Optional[Dict[str, Any]]:
+    try:
+        with open(GPU_PROBE_PATH, "r", encoding="utf-8") as f: data = json.load(f)
+        if data.get("key") != _gpu_probe_key(): return None
+        if not isinstance(data.get("versions"), dict) or not isinstance(data.get("gpu_info"), dict): return None
+        return {"versions": data["versions"], "gpu_info": data["gpu_info"]}
+    except Exception:
+        return None
+
+def _write_gpu_probe_cache(caps: Dict[str, Any]) -> None:
+    tmp_path = GPU_PROBE_PATH + ".tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"key": _gpu_probe_key(), **caps}, f, ensure_ascii=False)
+        os.replace(tmp_path, GPU_PROBE_PATH)
+    except Exception as e:
+        dbg(f"gpu probe cache write failed: {e}")
+
 # ---------------------- Separation via child script ----------------------
 
 class SidecarWorker:
@@ -311,6 +491,10 @@ class SidecarWorker:
         self._current_stage: str = STAGE_READY
         self._stderr_pct_last: Dict[str, int] = {STAGE_DL: -1, STAGE_LOAD: -1}
         self._stderr_last_emit: float = 0.0
+        # Child script location and environment are fixed for the sidecar's lifetime
+        self._child_path = os.path.join(os.path.dirname(__file__), "child_worker.py")
+        self._child_exists = os.path.isfile(self._child_path)
+        self._child_env = {"PYTHONIOENCODING": "utf-8", "PYTHONUTF8": "1", **os.environ}
 
     def busy(self) -> bool:
         alive_thread = self._thread is not None and self._thread.is_alive()
@@ -345,10 +529,12 @@ class SidecarWorker:
         for line in proc.stdout:
             line = line.strip()
             if not line: continue
+            if line[:1] != b"{":
+                dbg(f"child non-json: {line[:200]!r}"); continue
             try:
-                ev = json.loads(line)
+                ev = _LOADS(line)
             except Exception as e:
-                dbg(f"child bad json: {e}: {line[:200]}"); continue
+                dbg(f"child bad json: {e}: {line[:200]!r}"); continue
             # normalize stage to attach stage_key
             zh = str(ev.get("stage") or "")
             if ev.get("type") == "status" and ev.get("stage") in ("待命","READY","Idle"):
@@ -366,20 +552,22 @@ class SidecarWorker:
     def _read_child_stderr(self, proc: subprocess.Popen) -> None:
         if proc.stderr is None:
             return
-        pct_re = re.compile(r'(\d{1,3})%\|')  # matches " 42%|████..."
-        for raw in proc.stderr:
+        err_out = getattr(sys.stderr, "buffer", None)
+        for raw in _iter_raw_lines(proc.stderr):
             # Always mirror child's stderr for debugging:
             try:
-                sys.stderr.write(raw)
-                sys.stderr.flush()
+                if err_out is not None: err_out.write(raw); err_out.flush()
+                else: sys.stderr.write(raw.decode("utf-8", errors="replace")); sys.stderr.flush()
             except Exception:
                 pass
+            if b"%|" not in raw:
+                continue
             # Parse tqdm only during Download/Load
             try:
                 stage = self._current_stage
                 if stage not in (STAGE_DL, STAGE_LOAD):
                     continue
-                m = pct_re.search(raw)
+                m = _PCT_RE.search(raw)
                 if not m:
                     continue
                 pct = max(0, min(100, int(m.group(1))))
@@ -427,8 +615,8 @@ class SidecarWorker:
                 self._stderr_pct_last[STAGE_LOAD] = -1
                 self._stderr_last_emit = 0.0
 
-                child_path = os.path.join(os.path.dirname(__file__), "child_worker.py")
-                if not os.path.isfile(child_path):
+                child_path = self._child_path
+                if not self._child_exists:
                     send_event({"type":"error","where":"separate","msg":"找不到子程序 child_worker.py"})
                     send_event({"type":"status","stage":STAGE_READY,"msg":"錯誤","stage_key":_stage_key_from_zh(STAGE_READY)})
                     return
@@ -437,24 +625,20 @@ class SidecarWorker:
                 payload2["use_gpu"] = bool(payload.get("use_gpu", False))
 
                 # --- minimal fix: use the sidecar venv python, not sys.executable ---
-                exe = _find_sidecar_python(want_gpu=bool(payload.get("use_gpu", False)))
+                exe = _find_sidecar_python(bool(payload.get("use_gpu", False)))
                 args = [exe, "-u", "-X", "utf8", child_path]
                 dbg(f"separate: starting child with: {shlex.join(args)}")
 
-                env = os.environ.copy()
-                env.setdefault("PYTHONIOENCODING", "utf-8")
-                env.setdefault("PYTHONUTF8", "1")
-
                 self._child = subprocess.Popen(
                     args,
                     stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
                     cwd=os.path.dirname(child_path),
-                    bufsize=1, universal_newlines=True, encoding="utf-8", env=env,
+                    env=self._child_env,
                 )
 
                 # Feed payload then close child's stdin
                 assert self._child.stdin is not None
-                self._child.stdin.write(json.dumps(payload2, ensure_ascii=False) + "\n")
+                self._child.stdin.write((json.dumps(payload2, ensure_ascii=False) + "\n").encode("utf-8"))
                 self._child.stdin.flush()
                 if self._child.stdin: self._child.stdin.close()
 
@@ -464,15 +648,25 @@ class SidecarWorker:
                 self._child_err_reader = threading.Thread(target=self._read_child_stderr, args=(self._child,), daemon=True)
                 self._child_err_reader.start()
 
-                # Wait for child to exit
+                # Wait for child to exit (blocking wait; wakes every 0.5 s only to check abort)
                 while True:
-                    code = self._child.poll()
-                    if code is not None:
+                    try:
+                        code = self._child.wait(timeout=0.5)
                         dbg(f"separate: child exited with code {code}")
                         break
+                    except subprocess.TimeoutExpired:
+                        pass
                     if self._abort_evt.is_set():
-                        time.sleep(0.1); continue
-                    time.sleep(0.1)
+                        # abort() already sent terminate; escalate to kill if the child ignores it
+                        try:
+                            code = self._child.wait(timeout=5)
+                        except subprocess.TimeoutExpired:
+                            dbg("separate: child ignored terminate; killing")
+                            try: self._child.kill()
+                            except Exception: pass
+                            code = self._child.wait()
+                        dbg(f"separate: child exited with code {code} after abort")
+                        break
 
                 # If not canceled and child didn't explicitly emit done/error, return to READY
                 if not self._abort_evt.is_set():
@@ -495,68 +689,85 @@ class SidecarWorker:
 class SidecarService:
     def __init__(self) -> None:
         self.worker = SidecarWorker()
-
-    def hello(self) -> None:
-        api = "0.1.0"
-        try:
-            import audio_separator as asep; sep_ver = getattr(asep, "__version__", "unknown")
-        except Exception:
-            sep_ver = "unavailable"
-        try:
-            import torch; torch_ver = getattr(torch, "__version__", "unavailable")
-        except Exception:
-            torch_ver = "unavailable"
-        try:
-            import onnxruntime as ort; ort_ver = getattr(ort, "__version__", "unavailable")
-        except Exception:
-            ort_ver = "unavailable"
-        send_event({"type":"hello","api":api,"sep_version":sep_ver,"torch":torch_ver,"ort":ort_ver})
-        # Emit a one-shot GPU capability snapshot for the GUI label
+        self._probed = False  # True once this process has run (or scheduled) a live capability probe
+        # Warm the interpreter lookup for both modes while hello() runs
+        threading.Thread(target=lambda: (_find_sidecar_python(False), _find_sidecar_python(True)), daemon=True).start()
+
+    def _probe_capabilities(self) -> Dict[str, Any]:
+        """Import the runtimes and collect version strings + GPU capability snapshot."""
+        # Import the three heavy modules concurrently so torch init overlaps the others
+        with ThreadPoolExecutor(max_workers=3) as ex:
+            f_sep, f_torch, f_ort = ex.submit(_audio_separator), ex.submit(_torch), ex.submit(_onnxruntime)
+            asep, torch, ort = f_sep.result(), f_torch.result(), f_ort.result()
+        sep_ver = getattr(asep, "__version__", "unknown") if asep is not None else "unavailable"
+        torch_ver = getattr(torch, "__version__", "unavailable") if torch is not None else "unavailable"
+        ort_ver = getattr(ort, "__version__", "unavailable") if ort is not None else "unavailable"
         cuda = False
         torch_cuda = False
         gpu_name = ""
         ort_providers = []
         ort_device = "CPU"
         try:
-            import onnxruntime as ort
-            if hasattr(ort, "get_available_providers"):
-                ort_providers = list(ort.get_available_providers())
-                cuda = "CUDAExecutionProvider" in ort_providers
-            if hasattr(ort, "get_device"):
-                ort_device = ort.get_device()
+            if ort is not None:
+                if hasattr(ort, "get_available_providers"):
+                    ort_providers = list(ort.get_available_providers())
+                    cuda = "CUDAExecutionProvider" in ort_providers
+                if hasattr(ort, "get_device"):
+                    ort_device = ort.get_device()
         except Exception:
             pass
         try:
-            import torch
-            torch_cuda = bool(getattr(torch, "cuda", None) and torch.cuda.is_available())
-            if torch_cuda:
-                gpu_name = torch.cuda.get_device_name(0)
+            if torch is not None:
+                torch_cuda = bool(getattr(torch, "cuda", None) and torch.cuda.is_available())
+                if torch_cuda:
+                    gpu_name = torch.cuda.get_device_name(0)
         except Exception:
             pass
         # Determine availability
         available = bool(
             cuda or torch_cuda or ('CUDAExecutionProvider' in ort_providers) or (ort_device and ort_device.lower() != 'cpu')
         )
-        # Package into info dict
-        gpu_info_payload = {
-            "available": available,
-            "cuda": cuda,
-            "torch_cuda": torch_cuda,
-            "gpu_name": gpu_name,
-            "ort_providers": ort_providers,
-            "ort_device": ort_device,
+        return {
+            "versions": {"sep_version": sep_ver, "torch": torch_ver, "ort": ort_ver},
+            "gpu_info": {
+                "available": available,
+                "cuda": cuda,
+                "torch_cuda": torch_cuda,
+                "gpu_name": gpu_name,
+                "ort_providers": ort_providers,
+                "ort_device": ort_device,
+            },
         }
+
+    def _emit_gpu_info(self, gpu_info_payload: Dict[str, Any]) -> None:
         # Emit with nested info and top-level for backwards compat
-        send_event({
-            "type": "gpu_info",
-            "info": gpu_info_payload,
-            "available": available,
-            "cuda": cuda,
-            "torch_cuda": torch_cuda,
-            "gpu_name": gpu_name,
-            "ort_providers": ort_providers,
-            "ort_device": ort_device,
-        })
+        send_event({"type": "gpu_info", "info": gpu_info_payload, **gpu_info_payload})
+
+    def _reprobe_in_background(self, cached: Dict[str, Any]) -> None:
+        # Stale-while-revalidate: refresh the on-disk probe and re-emit only if the GPU picture changed
+        try:
+            caps = self._probe_capabilities()
+            _write_gpu_probe_cache(caps)
+            if caps.get("gpu_info") != cached.get("gpu_info"):
+                dbg("hello: GPU probe changed since last launch; re-emitting gpu_info")
+                self._emit_gpu_info(caps["gpu_info"])
+        except Exception as e:
+            dbg(f"hello: background GPU probe failed: {e}")
+
+    def hello(self) -> None:
+        api = "0.1.0"
+        # First hello of the process may answer from the persisted probe (torch import is ~800 ms cold)
+        cached = None if self._probed else _read_gpu_probe_cache()
+        if cached:
+            caps = cached
+            threading.Thread(target=self._reprobe_in_background, args=(cached,), daemon=True).start()
+        else:
+            caps = self._probe_capabilities()
+            _write_gpu_probe_cache(caps)
+        self._probed = True
+        send_event({"type":"hello","api":api,**caps["versions"]})
+        # Emit a one-shot GPU capability snapshot for the GUI label
+        self._emit_gpu_info(caps["gpu_info"])
         send_event({"type":"status","stage":STAGE_READY,"msg":"就緒","stage_key":_stage_key_from_zh(STAGE_READY)})
 
     def handle(self, obj: Dict[str, Any]) -> None:
@@ -602,6 +813,7 @@ def main() -> None:
             tb = traceback.format_exc(); dbg(f"Dispatch error: {e}\n{tb}")
             send_event({"type":"error","where":"general","msg":str(e)})
     dbg("stdin closed; exiting.")
+    flush_events()
 
 if __name__ == "__main__":
     try: main()
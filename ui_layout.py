@@ -1,4 +1,5 @@
 import FreeSimpleGUI as sg
+import functools
 import platform
 import os
 import sys
@@ -23,12 +24,17 @@ Example usage::
     layout = create_layout(i18n.t)
 
 The factory does not maintain any global state. The caller is
-responsible for passing a translation function when building the UI and
-for updating text values when the language changes at runtime.
+responsible for passing a translation function when building the UI;
+`relocalize` re-translates the static texts of a built window in place
+when the language changes at runtime.
 """
 
+# Resolved once at import; neither changes during the process lifetime
+_SYSTEM = platform.system()
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(".")
+
 # --- DPI Awareness Fix for Windows ---
-if platform.system() == "Windows":
+if _SYSTEM == "Windows":
     try:
         import ctypes
         ctypes.windll.shcore.SetProcessDpiAwareness(2)
@@ -41,38 +47,58 @@ CUSTOM_FONT_FILE = "GenSenRounded2TW-R.otf"
 
 
 EXPLORER_PANEL_WIDTH = 440
+TOOLTIP_DELAY_MS = 500
+SLIDER_DEBOUNCE_MS = 30
+_DEBOUNCED_SLIDERS = ("-PITCH_SLIDER-", "-PROGRESS-", "-INST_VOLUME-", "-VOCAL_VOLUME-")
+
+_AUDIO_EXT_GLOB = "*.mp3 *.wav *.flac *.m4a *.aac *.ogg *.opus *.wma"
+_NORMALIZE_TARGETS = ('-14.0 (YouTube)', '-15.0 (Twitch)', '-16.0 (Apple Music/TikTok)', '-23.0 (EBU R128)')
+_SAMPLE_RATES = (44100, 48000)
 
-if platform.system() == "Windows":
+if _SYSTEM == "Windows":
     INFO_FONT = ("Segoe UI Symbol", 11)
 else:
     INFO_FONT = (CUSTOM_FONT_NAME, 11)
 
+# Shared font specs: every widget gets the same descriptor, so Tk resolves
+# each font once and serves the rest from its font cache.
+TITLE_FONT = (CUSTOM_FONT_NAME, 14)
+SMALL_FONT = (CUSTOM_FONT_NAME, 9)
+TOOLTIP_FONT = SMALL_FONT
+
+# Shared element styles, built once and splatted into the layout
+_TITLE_STYLE = dict(font=TITLE_FONT)
+_SWATCH_STYLE = dict(text_color='black', font=SMALL_FONT)
+_VOLUME_LABEL_STYLE = dict(size=(7, 1), pad=((0, 0), (15, 0)))
+_MUTE_BUTTON_STYLE = dict(size=(3, 1), pad=((0, 5), (15, 0)), button_color=(None, None))
+_VOLUME_SLIDER_STYLE = dict(range=(0, 150), orientation='h', size=(30, 15), enable_events=True, expand_x=False)
+_INFO_KW = dict(font=INFO_FONT)
+
 
 def resource_path(relative_path):
     """Return absolute path to resource, working for dev and PyInstaller."""
-    try:
-        base_path = sys._MEIPASS  # type: ignore[attr-defined]
-    except Exception:
-        base_path = os.path.abspath(".")
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, relative_path)
 
 
-try:
-    font_path = resource_path(os.path.join("assets", CUSTOM_FONT_FILE))
-    if platform.system() == "Windows" and os.path.exists(font_path):
-        import ctypes
-        gdi32 = ctypes.WinDLL('gdi32')
-        AddFontResourceEx = gdi32.AddFontResourceExW
-        AddFontResourceEx.argtypes = [ctypes.c_wchar_p, ctypes.c_uint, ctypes.c_void_p]
-        AddFontResourceEx.restype = ctypes.c_int
-        FR_PRIVATE = 0x10  # only for this process; no system-wide install
+def _load_font(font_path):
+    """Register the bundled font privately for this process (Windows only)."""
+    import ctypes
+    gdi32 = ctypes.WinDLL('gdi32')
+    AddFontResourceEx = gdi32.AddFontResourceExW
+    AddFontResourceEx.argtypes = [ctypes.c_wchar_p, ctypes.c_uint, ctypes.c_void_p]
+    AddFontResourceEx.restype = ctypes.c_int
+    FR_PRIVATE = 0x10  # only for this process; no system-wide install
+    return AddFontResourceEx(font_path, FR_PRIVATE, None) > 0
 
-        if AddFontResourceEx(font_path, FR_PRIVATE, None) > 0:
-            sg.set_options(font=(CUSTOM_FONT_NAME, 11))
 
-    else:
-        raise FileNotFoundError
-except Exception:
+font_path = resource_path(os.path.join("assets", CUSTOM_FONT_FILE))
+if _SYSTEM == "Windows" and os.path.exists(font_path):
+    try:
+        if _load_font(font_path):
+            sg.set_options(font=(CUSTOM_FONT_NAME, 11))
+    except OSError:
+        sg.set_options(font=("Helvetica", 10))
+else:
     sg.set_options(font=("Helvetica", 10))
 
 
@@ -80,54 +106,75 @@ class TooltipManager:
     """
     A helper for attaching tooltips to widgets using native Tk windows.
 
-    This class is intentionally unchanged from the original implementation
-    to preserve existing behaviour. It can be used to bind tooltip text
-    to any widget. The caller should provide translated tooltip strings
-    when binding in order to support multiple languages.
+    It can be used to bind tooltip text to any widget. The caller should
+    provide translated tooltip strings when binding in order to support
+    multiple languages. A single borderless Toplevel is created on first
+    use and reused for every tooltip; hiding withdraws it rather than
+    destroying it.
     """
 
     def __init__(self, window):
         self._tk_root = window.TKroot
-        self._tooltip = None
+        self._tooltip = None  # one Toplevel reused for every tooltip, withdrawn when hidden
+        self._label = None
         self._show_timer = None
+        # Single pending-show slot shared by every bound widget
+        self._hover_widget = None
+        self._hover_text = None
+
+    def bind(self, widget, text, delay_ms=TOOLTIP_DELAY_MS):
+        # Text lives on the widget so both events share two bound methods (no per-widget closures).
+        # Bindings replace (not add to) existing ones, so re-binding on language change is idempotent.
+        widget._tt_text = text
+        widget._tt_delay = delay_ms
+        widget.bind("<Enter>", self._on_enter)
+        widget.bind("<Leave>", self._on_leave)
+
+    def _on_enter(self, event):
+        w = event.widget
+        self._schedule_show(w, getattr(w, "_tt_text", ""), getattr(w, "_tt_delay", TOOLTIP_DELAY_MS))
+
+    def _on_leave(self, event):
+        self._hide()
 
-    def bind(self, widget, text, delay_ms=500):
-        widget.bind("<Enter>", lambda e, w=widget, t=text, d=delay_ms: self._schedule_show(w, t, d))
-        widget.bind("<Leave>", lambda e: self._hide())
-
-    def _schedule_show(self, widget, text, delay_ms=500):
+    def _schedule_show(self, widget, text, delay_ms=TOOLTIP_DELAY_MS):
         self._hide()
         if self._tk_root:
-            self._show_timer = self._tk_root.after(delay_ms, lambda: self._show(widget, text))
+            self._hover_widget = widget
+            self._hover_text = text
+            self._show_timer = self._tk_root.after(delay_ms, self._show_pending)
+
+    def _show_pending(self):
+        self._show_timer = None
+        widget, text = self._hover_widget, self._hover_text
+        if widget is not None:
+            self._show(widget, text)
 
     def _hide(self):
         if self._show_timer and self._tk_root:
             self._tk_root.after_cancel(self._show_timer)
             self._show_timer = None
+        self._hover_widget = None
+        self._hover_text = None
         if self._tooltip:
-            self._tooltip.destroy()
-            self._tooltip = None
+            self._tooltip.withdraw()
 
-    def _show(self, widget, text, dx=25, dy=20):
-        if not self._tk_root:
-            return
-        # Destroy any existing tooltip
-        self._hide()
-        x = widget.winfo_rootx() + dx
-        y = widget.winfo_rooty() + dy
+    def _ensure_tooltip(self):
+        """Create the reusable (withdrawn) tooltip window on first use."""
+        if self._tooltip is not None:
+            return self._tooltip
         self._tooltip = tk.Toplevel(self._tk_root)
+        self._tooltip.withdraw()
         self._tooltip.wm_overrideredirect(True)  # Make it borderless
-        self._tooltip.wm_geometry(f"+{x}+{y}")
         bg_color = "#7894b4"  #sg.theme_background_color()
         text_color = sg.theme_text_color()
-        label = tk.Label(
+        self._label = tk.Label(
             self._tooltip,
-            text=text,
             justify=tk.LEFT,
             background=bg_color,
             foreground=text_color,
             wraplength=300,
-            font=(CUSTOM_FONT_NAME, 9),
+            font=TOOLTIP_FONT,
             relief=tk.SOLID,
             borderwidth=0,
             # add a crisp white outline so it doesn't blend with the app bg
@@ -135,7 +182,34 @@ class TooltipManager:
             highlightbackground="white",
             highlightcolor="white",
         )
-        label.pack(ipadx=5, ipady=3)
+        self._label.pack(ipadx=5, ipady=3)
+        return self._tooltip
+
+    def prewarm(self):
+        """
+        Realize the tooltip window once, off-screen, so the window-manager
+        cost is paid at startup instead of on the first hover.
+        """
+        if not self._tk_root:
+            return
+        tooltip = self._ensure_tooltip()
+        tooltip.wm_geometry("+-10000+-10000")
+        tooltip.update_idletasks()
+        tooltip.deiconify()
+        tooltip.withdraw()
+
+    def _show(self, widget, text, dx=25, dy=20):
+        if not self._tk_root:
+            return
+        # Hide any visible tooltip; the window itself is reused
+        self._hide()
+        x = widget.winfo_rootx() + dx
+        y = widget.winfo_rooty() + dy
+        tooltip = self._ensure_tooltip()
+        self._label.configure(text=text)
+        tooltip.wm_geometry(f"+{x}+{y}")
+        tooltip.deiconify()
+        tooltip.lift()
 
     def show_immediate(self, widget, text, dx=25, dy=20):
         self._show(widget, text, dx, dy)
@@ -145,6 +219,99 @@ class TooltipManager:
 
     def close(self):
         self._hide()
+        if self._tooltip is not None:
+            try:
+                self._tooltip.destroy()
+            except Exception:
+                pass
+            self._tooltip = None
+
+
+# Element key -> i18n key for every static text that follows the language
+_TEXT_KEYS = {
+    'file_explorer_title': 'file_explorer_title',
+    '-FOLDER_PATH-': 'folder_path_placeholder',
+    '-BACK-': 'back_button',
+    '-CHANGE_FOLDER-': 'change_folder_button',
+    '-OPEN_FOLDER-': 'open_folder_button',
+    '-REFRESH-': 'refresh_button',
+    'vocal_separator_title': 'vocal_separator_title',
+    '-YT_MODE-': 'ui.youtube.toggle',
+    '-YT_LABEL-': 'ui.youtube.toggle',
+    '-SEP_GPU_STATUS-': 'gpu_status_checking',
+    'song_file_label': 'song_file_label',
+    '-YT_URL_LABEL-': 'ui.youtube.url_label',
+    '-SONG_FILE_BROWSE-': 'browse_file_button',
+    '-START_SEPARATION-': 'start_separation_button',
+    '-YT_DL_ONLY-': 'ui.youtube.fetch_only',
+    '-YT_DL_SEP-': 'ui.youtube.fetch_and_sep',
+    '-OPEN_SEPARATOR_SETTINGS-': 'separator_settings_button',
+    '-SEPARATOR_STATUS-': 'separator_status_ready',
+    'audio_loader_title': 'audio_loader_title',
+    'instrumental_label': 'instrumental_label',
+    'vocal_label': 'vocal_label',
+    'headphone_label': 'headphone_label',
+    'virtual_label': 'virtual_label',
+    'sample_rate_label': 'sample_rate_label',
+    'hz_label': 'hz_label',
+    '-REFRESH_DEVICES-': 'refresh_devices_button',
+    'normalize_label': 'normalize_label',
+    'lufs_label': 'lufs_label',
+    'pitch_label': 'pitch_label',
+    '-LOAD-': 'load_audio_button',
+    'player_title': 'player_title',
+    '-REWIND-': 'rewind_button',
+    '-PLAY_PAUSE-': 'play_button',
+    '-FORWARD-': 'forward_button',
+    '-STOP-': 'stop_button',
+    'instrumental_volume_label': 'instrumental_volume_label',
+    'vocal_volume_label': 'vocal_volume_label',
+}
+# Checkbox-style elements take their label through update(text=...)
+_TEXT_KW_KEYS = frozenset({'-YT_MODE-'})
+
+
+def relocalize(window, t, overrides=None):
+    """
+    Re-translate the static texts of an existing window in place.
+
+    :param window: The finalized main window.
+    :param t: Translation function.
+    :param overrides: Optional element key -> i18n key mapping for texts
+                      that depend on runtime state (e.g. Play vs Pause).
+    """
+    keys = window.AllKeysDict
+    for widget_key, trans_key in _TEXT_KEYS.items():
+        if widget_key not in keys:
+            continue
+        if overrides and widget_key in overrides:
+            trans_key = overrides[widget_key]
+        try:
+            if widget_key in _TEXT_KW_KEYS:
+                window[widget_key].update(text=t(trans_key))
+            else:
+                window[widget_key].update(t(trans_key))
+        except Exception:
+            pass
+
+
+def _pin_col(rows, key, visible=True, expand_x=True):
+    """A pinned, padding-free Column so toggling visibility keeps its slot."""
+    return sg.pin(sg.Column(rows, key=key, pad=(0, 0), expand_x=expand_x, visible=visible))
+
+
+def _info(key, tooltip=None):
+    """The small 'ⓘ' hover icon placed next to labels."""
+    return sg.Text("ⓘ", key=key, tooltip=tooltip, **_INFO_KW)
+
+
+def _volume_row(t, label_key, mute_key, slider_key, default_value):
+    """One volume row: label, mute toggle and 0-150 slider."""
+    return [
+        sg.Text(t(label_key), key=label_key, **_VOLUME_LABEL_STYLE),
+        sg.Button('🔊', key=mute_key, **_MUTE_BUTTON_STYLE),
+        sg.Slider(default_value=default_value, key=slider_key, **_VOLUME_SLIDER_STYLE),
+    ]
 
 
 def create_layout(t):
@@ -155,10 +322,14 @@ def create_layout(t):
               translated string for the current language.
     :return: The constructed layout definition for FreeSimpleGUI.
     """
+    # Memoize lookups for this build; several keys (e.g. "stop_button") repeat
+    t = functools.lru_cache(maxsize=None)(t)
+    audio_file_types = ((t("audio_files"), _AUDIO_EXT_GLOB),)
+
     # File explorer panel
     file_explorer_panel = [
-        [sg.Text(t("file_explorer_title"), key="file_explorer_title", font=(CUSTOM_FONT_NAME, 14)),
-         sg.Text("ⓘ", key='-EXPLORER_INFO-', tooltip=t("explorer_info_tooltip"), font=INFO_FONT)],
+        [sg.Text(t("file_explorer_title"), key="file_explorer_title", **_TITLE_STYLE),
+         _info('-EXPLORER_INFO-', t("explorer_info_tooltip"))],
         [
             sg.Button(t("back_button"), key="-BACK-", size=(2, 1)),
             sg.Input(t("folder_path_placeholder"), key="-FOLDER_PATH-", size=(9, None), readonly=True, expand_x=True, enable_events=True),
@@ -166,8 +337,8 @@ def create_layout(t):
         ],
         [sg.Listbox(values=[], key="-FILE_LIST-", expand_y=True, expand_x=True, enable_events=True)],
         [
-            sg.Text(t("left_click_choose_instrumental"), background_color='#a8d8ea', text_color='black', font=(CUSTOM_FONT_NAME, 9)),
-            sg.Text(t("right_click_choose_vocal"), background_color='#f3c9d8', text_color='black', font=(CUSTOM_FONT_NAME, 9), pad=((2, 0), (0, 0))),
+            sg.Text(t("left_click_choose_instrumental"), background_color='#a8d8ea', **_SWATCH_STYLE),
+            sg.Text(t("right_click_choose_vocal"), background_color='#f3c9d8', **_SWATCH_STYLE, pad=((2, 0), (0, 0))),
             sg.Push(),
             sg.Button(t("refresh_button"), key="-REFRESH-", size=(2, 1), pad=((0, 1), (0, 0))),
             sg.Button(t("open_folder_button"), key="-OPEN_FOLDER-", size=(2, 1))
@@ -177,15 +348,15 @@ def create_layout(t):
     # Vocal separator panel
     vocal_separator_panel = [
         [
-            sg.Text(t("vocal_separator_title"), key="vocal_separator_title", font=(CUSTOM_FONT_NAME, 14)),
+            sg.Text(t("vocal_separator_title"), key="vocal_separator_title", **_TITLE_STYLE),
             sg.Text(t("gpu_status_checking"), key='-SEP_GPU_STATUS-', background_color='#e0e0e0', text_color='black', pad=((8, 0), (0, 0)))
         ],
         [sg.Checkbox("", key="-YT_MODE-", default=False, enable_events=True), sg.Text(t("ui.youtube.toggle"), key="-YT_LABEL-")],
-        [sg.pin(sg.Column([[sg.Text(t("song_file_label"), key="song_file_label"), sg.Input(key="-SONG_FILE-", expand_x=True, readonly=True), sg.FileBrowse(t("browse_file_button"), file_types=((t("audio_files"), "*.mp3 *.wav *.flac *.m4a *.aac *.ogg *.opus *.wma"),), key="-SONG_FILE_BROWSE-")]], key="-FILE_ROW-", pad=(0, 0), expand_x=True, visible=True))],
-        [sg.pin(sg.Column([[sg.Text(t("ui.youtube.url_label"), key="-YT_URL_LABEL-"), sg.Input(key="-YT_URL-", expand_x=True), sg.Text("ⓘ", key="-YT_INFO-", font=INFO_FONT)]], key="-YT_ROW-", pad=(0, 0), expand_x=True, visible=False))],
+        [_pin_col([[sg.Text(t("song_file_label"), key="song_file_label"), sg.Input(key="-SONG_FILE-", expand_x=True, readonly=True), sg.FileBrowse(t("browse_file_button"), file_types=audio_file_types, key="-SONG_FILE_BROWSE-")]], "-FILE_ROW-")],
+        [_pin_col([[sg.Text(t("ui.youtube.url_label"), key="-YT_URL_LABEL-"), sg.Input(key="-YT_URL-", expand_x=True), _info("-YT_INFO-")]], "-YT_ROW-", visible=False)],
         [
-            sg.pin(sg.Column([[sg.Button(t("start_separation_button"), key="-START_SEPARATION-", size=(12, 1))]], key="-FILE_BUTTONS-", pad=(0, 0), visible=True)),
-            sg.pin(sg.Column([[sg.Button(t("ui.youtube.fetch_only"), key="-YT_DL_ONLY-", size=(14, 1)), sg.Button(t("ui.youtube.fetch_and_sep"), key="-YT_DL_SEP-", size=(16, 1)), sg.Button(t("stop_button"), key="-YT_TERMINATE-", size=(10, 1), visible=False)]], key="-YT_BUTTONS-", pad=(0, 0), visible=False)),
+            _pin_col([[sg.Button(t("start_separation_button"), key="-START_SEPARATION-", size=(12, 1))]], "-FILE_BUTTONS-", expand_x=False),
+            _pin_col([[sg.Button(t("ui.youtube.fetch_only"), key="-YT_DL_ONLY-", size=(14, 1)), sg.Button(t("ui.youtube.fetch_and_sep"), key="-YT_DL_SEP-", size=(16, 1)), sg.Button(t("stop_button"), key="-YT_TERMINATE-", size=(10, 1), visible=False)]], "-YT_BUTTONS-", visible=False, expand_x=False),
             sg.Button(t("separator_settings_button"), key="-OPEN_SEPARATOR_SETTINGS-", size=(8, 1)),
             sg.Text("", key='-SET_MSG-', size=(20, 1), text_color="lightgreen"),
         ],
@@ -200,20 +371,20 @@ def create_layout(t):
 
     # Audio player panel
     audio_player_panel = [
-        [sg.Text(t("audio_loader_title"), key="audio_loader_title", font=(CUSTOM_FONT_NAME, 14)), sg.Text("ⓘ", key='-PLAYER_INFO-', tooltip=t("player_info_tooltip"), font=INFO_FONT)],
+        [sg.Text(t("audio_loader_title"), key="audio_loader_title", **_TITLE_STYLE), _info('-PLAYER_INFO-', t("player_info_tooltip"))],
         [sg.Text(t("instrumental_label"), key="instrumental_label", size=(12, 1)), sg.Text(t("instrumental_display_placeholder"), key="-INSTRUMENTAL_DISPLAY-", expand_x=True)],
         [sg.Text(t("vocal_label"), key="vocal_label", size=(12, 1)), sg.Text(t("vocal_display_placeholder"), key="-VOCAL_DISPLAY-", expand_x=True)],
         [
-            sg.Text(t("headphone_label"), key="headphone_label"), sg.Text('ⓘ', key='-INFO1-', font=INFO_FONT),
+            sg.Text(t("headphone_label"), key="headphone_label"), _info('-INFO1-'),
             sg.Combo([], default_value="", key="-HEADPHONE-", expand_x=True, enable_events=True)
         ],
         [
-            sg.Text(t("virtual_label"), key="virtual_label"), sg.Text('ⓘ', key='-INFO2-', font=INFO_FONT),
+            sg.Text(t("virtual_label"), key="virtual_label"), _info('-INFO2-'),
             sg.Combo([], default_value="", key="-VIRTUAL-", expand_x=True, enable_events=True)
         ],
         [
             sg.Text(t("sample_rate_label"), key="sample_rate_label"),
-            sg.Combo([44100, 48000], key="-SAMPLE_RATE-", default_value=44100, enable_events=True),
+            sg.Combo(_SAMPLE_RATES, key="-SAMPLE_RATE-", default_value=_SAMPLE_RATES[0], enable_events=True),
             sg.Text(t("hz_label"), key="hz_label"),
             sg.Push(),
             sg.Text("", key="-DEVICE_SCAN_STATUS-", size=(8, 1)),
@@ -222,8 +393,8 @@ def create_layout(t):
         [
             sg.Checkbox("", key="-NORMALIZE-", default=False, enable_events=True),
             sg.Text(t("normalize_label"), key="normalize_label"),
-            sg.Combo(['-14.0 (YouTube)', '-15.0 (Twitch)', '-16.0 (Apple Music/TikTok)', '-23.0 (EBU R128)'], key="-NORMALIZE_TARGET-", default_value='-14.0 (YouTube)', size=(22, 1), enable_events=True, disabled=True),
-            sg.Text(t("lufs_label"), key="lufs_label"), sg.Text('ⓘ', key='-LUFS_INFO-', font=INFO_FONT)
+            sg.Combo(_NORMALIZE_TARGETS, key="-NORMALIZE_TARGET-", default_value=_NORMALIZE_TARGETS[0], size=(22, 1), enable_events=True, disabled=True),
+            sg.Text(t("lufs_label"), key="lufs_label"), _info('-LUFS_INFO-')
         ],
         [
             sg.Text(t("pitch_label"), key="pitch_label"),
@@ -233,7 +404,7 @@ def create_layout(t):
         ],
         [sg.Button(t("load_audio_button"), key="-LOAD-", disabled=True), sg.ProgressBar(max_value=100, orientation='h', size=(20, 20), key='-LOAD_PROGRESS-'), sg.Text("", key="-LOAD_STATUS-")],
         [sg.HSep()],
-        [sg.Text(t("player_title"), key="player_title", font=(CUSTOM_FONT_NAME, 14))],
+        [sg.Text(t("player_title"), key="player_title", **_TITLE_STYLE)],
         [
             sg.Slider(range=(0, 0), orientation='h', size=(40, 15), key="-PROGRESS-", enable_events=True, resolution=0.1, disabled=True, disable_number_display=True, expand_x=True),
             sg.Text("00:00:00 / 00:00:00", key="-TIME_DISPLAY-")
@@ -244,16 +415,8 @@ def create_layout(t):
             sg.Button(t("forward_button"), key="-FORWARD-", disabled=True),
             sg.Button(t("stop_button"), key="-STOP-", disabled=True)
         ],
-        [
-            sg.Text(t("instrumental_volume_label"), size=(7, 1), pad=((0, 0), (15, 0))),
-            sg.Button('🔊', key='-INST_MUTE-', size=(3, 1), pad=((0, 5), (15, 0)), button_color=(None, None)),
-            sg.Slider(range=(0, 150), default_value=70, orientation='h', size=(30, 15), key="-INST_VOLUME-", enable_events=True, expand_x=False)
-        ],
-        [
-            sg.Text(t("vocal_volume_label"), size=(7, 1), pad=((0, 0), (15, 0))),
-            sg.Button('🔊', key='-VOC_MUTE-', size=(3, 1), pad=((0, 5), (15, 0)), button_color=(None, None)),
-            sg.Slider(range=(0, 150), default_value=100, orientation='h', size=(30, 15), key="-VOCAL_VOLUME-", enable_events=True, expand_x=False)
-        ],
+        _volume_row(t, "instrumental_volume_label", '-INST_MUTE-', "-INST_VOLUME-", 70),
+        _volume_row(t, "vocal_volume_label", '-VOC_MUTE-', "-VOCAL_VOLUME-", 100),
     ]
 
 
@@ -306,3 +469,33 @@ def create_layout(t):
     return layout
 
 
+def debounce_sliders(window, keys=_DEBOUNCED_SLIDERS, delay_ms=SLIDER_DEBOUNCE_MS):
+    """
+    Coalesce slider change events while dragging. Each slider's Tk command
+    is wrapped so that at most one event per `delay_ms` reaches the window;
+    the element's value is read when the event is delivered, so the last
+    position of a drag is never lost.
+
+    :param window: The finalized main window.
+    :param keys: Slider element keys to debounce.
+    :param delay_ms: Coalescing window in milliseconds.
+    """
+    root = window.TKroot
+    for key in keys:
+        if key not in window.AllKeysDict:
+            continue
+        element = window[key]
+        handler = getattr(element, "_SliderChangedHandler", None)
+        if handler is None:
+            continue
+        pending = [None]
+
+        def flush(handler=handler, pending=pending):
+            pending[0] = None
+            handler(None)
+
+        def on_change(_value, flush=flush, pending=pending):
+            if pending[0] is None:
+                pending[0] = root.after(delay_ms, flush)
+
+        element.Widget.configure(command=on_change)
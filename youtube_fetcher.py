@@ -3,14 +3,19 @@
 import os
 import re
 import shutil
+import ssl
 import subprocess
 import sys
 import tempfile
 import threading
 import time
 import json
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, Iterator, Optional
+from urllib.error import HTTPError
 from urllib.request import Request, urlopen
 
 
@@ -34,10 +39,18 @@ class YTDownloader:
     _REMOTE_CHECK_INTERVAL = 6 * 3600  # seconds
     _GITHUB_RELEASE_API = "https://api.github.com/repos/yt-dlp/yt-dlp/releases/latest"
     _USER_AGENT = "KHelperV2/1.0"
+    _RESOLVE_TTL = 60.0  # seconds a resolved ffmpeg/yt-dlp path is trusted without re-checking the disk
+    _DOWNLOAD_CHUNK = 1024 * 1024  # bytes per read while fetching yt-dlp.exe
+    # yt-dlp output is parsed as bytes; only lines handed to on_log are decoded
+    _PROGRESS_RE = re.compile(rb"(\d+(?:\.\d+)?)%")
+    _DEST_MARK = b"Destination:"
+    _EOL_RE = re.compile(rb"\r\n|\r|\n")
 
     def __init__(self, storage_root: Optional[str] = None) -> None:
         self._ffmpeg_path: Optional[str] = None
         self._ytdlp_path: Optional[str] = None
+        self._ffmpeg_checked_at = 0.0
+        self._ytdlp_checked_at = 0.0
         self._process: Optional[subprocess.Popen] = None
         self._lock = threading.Lock()
         self._is_downloading = False
@@ -45,6 +58,14 @@ class YTDownloader:
         self._storage_root = Path(storage_root) if storage_root else None
         self._remote_version_cache: Optional[tuple[str, str]] = None
         self._remote_cache_time = 0.0
+        self._remote_etag: Optional[str] = None
+        self._remote_cache_loaded = False
+        self._update_lock = threading.Lock()  # one update check/download at a time
+        self._update_thread: Optional[threading.Thread] = None
+        self._update_deferred = False  # an update hit a running download; retry when it ends
+        if self._storage_root:
+            # Refresh the managed yt-dlp off the download path; _resolve_ytdlp only waits if nothing else exists
+            self._start_background_update()
 
     def is_downloading(self) -> bool:
         with self._lock:
@@ -92,6 +113,69 @@ class YTDownloader:
             return None
         return storage / 'yt-dlp.version'
 
+    def _next_check_file(self) -> Optional[Path]:
+        storage = self._storage_dir()
+        if not storage:
+            return None
+        return storage / 'yt-dlp.next_check'
+
+    def _next_check_at(self, exe_path: Path) -> float:
+        """When the next update check is due; falls back to the binary's mtime plus the interval."""
+        path = self._next_check_file()
+        if path:
+            try:
+                return float(path.read_text(encoding='utf-8').strip())
+            except Exception:
+                pass
+        try:
+            return exe_path.stat().st_mtime + self._REMOTE_CHECK_INTERVAL
+        except OSError:
+            return 0.0
+
+    def _schedule_next_check(self) -> None:
+        path = self._next_check_file()
+        if not path:
+            return
+        try:
+            path.write_text(str(time.time() + self._REMOTE_CHECK_INTERVAL), encoding='utf-8')
+        except Exception:
+            pass
+
+    def _remote_cache_file(self) -> Optional[Path]:
+        storage = self._storage_dir()
+        if not storage:
+            return None
+        return storage / 'yt-dlp.release.json'
+
+    def _read_remote_cache(self) -> None:
+        """Seed the in-memory release cache from the copy persisted by a previous run."""
+        path = self._remote_cache_file()
+        if not path:
+            return
+        try:
+            data = json.loads(path.read_text(encoding='utf-8'))
+            tag, url = data['tag'], data['url']
+            fetched_at = float(data.get('fetched_at') or 0.0)
+        except Exception:
+            return
+        if tag and url:
+            self._remote_version_cache = (tag, url)
+            self._remote_cache_time = fetched_at
+            self._remote_etag = data.get('etag') or None
+
+    def _write_remote_cache(self) -> None:
+        path = self._remote_cache_file()
+        if not path or not self._remote_version_cache:
+            return
+        tag, url = self._remote_version_cache
+        payload = {'tag': tag, 'url': url, 'fetched_at': self._remote_cache_time, 'etag': self._remote_etag}
+        tmp = path.with_name(path.name + '.tmp')
+        try:
+            tmp.write_text(json.dumps(payload), encoding='utf-8')
+            os.replace(tmp, path)
+        except Exception:
+            pass
+
     def _read_version_file(self, path: Path) -> Optional[str]:
         try:
             return path.read_text(encoding='utf-8').strip() or None
@@ -133,22 +217,38 @@ class YTDownloader:
                 return part
         return cleaned
 
-    def _get_local_version(self, exe_path: Path) -> Optional[str]:
+    def _get_local_version(self, exe_path: Path, fresh_as: Optional[str] = None) -> Optional[str]:
         version_file = self._version_file_path()
         if version_file:
             cached = self._read_version_file(version_file)
             if cached:
                 return cached
+        if fresh_as:
+            # Written within the check interval: treat as current for this check instead of spawning
+            # `--version`, but don't record it (the binary's real version is unknown)
+            try:
+                if time.time() - exe_path.stat().st_mtime < self._REMOTE_CHECK_INTERVAL:
+                    return fresh_as
+            except OSError:
+                pass
         version_line = self._probe_local_version(exe_path)
         norm = self._normalize_version(version_line)
         if norm and version_file:
             self._write_version_file(version_file, norm)
         return norm or version_line
 
-    def _get_remote_release_info(self) -> Optional[tuple[str, str]]:
+    def _get_remote_release_info(self) -> tuple[Optional[tuple[str, str]], bool]:
+        """
+        Latest release as (tag, url), plus whether it is confirmed: fetched or
+        revalidated (304) now, or cached within the check interval. A stale
+        cache returned because the fetch failed is not confirmed.
+        """
         now = time.time()
+        if not self._remote_cache_loaded:
+            self._remote_cache_loaded = True
+            self._read_remote_cache()
         if self._remote_version_cache and (now - self._remote_cache_time) < self._REMOTE_CHECK_INTERVAL:
-            return self._remote_version_cache
+            return self._remote_version_cache, True
         info = None
         try:
             info = self._fetch_latest_release_info()
@@ -157,12 +257,29 @@ class YTDownloader:
         if info:
             self._remote_version_cache = info
             self._remote_cache_time = now
-        return info or self._remote_version_cache
+            self._write_remote_cache()
+            return info, True
+        return self._remote_version_cache, False
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _ssl_context() -> ssl.SSLContext:
+        """One TLS context (CA store loaded once) shared by the release check and the download."""
+        return ssl.create_default_context()
 
     def _fetch_latest_release_info(self) -> Optional[tuple[str, str]]:
-        req = Request(self._GITHUB_RELEASE_API, headers={'User-Agent': self._USER_AGENT, 'Accept': 'application/vnd.github+json'})
-        with urlopen(req, timeout=20) as resp:
-            data = json.loads(resp.read().decode('utf-8', 'replace'))
+        headers = {'User-Agent': self._USER_AGENT, 'Accept': 'application/vnd.github+json'}
+        if self._remote_etag and self._remote_version_cache:
+            headers['If-None-Match'] = self._remote_etag
+        req = Request(self._GITHUB_RELEASE_API, headers=headers)
+        try:
+            with urlopen(req, timeout=20, context=self._ssl_context()) as resp:
+                etag = resp.headers.get('ETag')
+                data = json.loads(resp.read().decode('utf-8', 'replace'))
+        except HTTPError as exc:
+            if exc.code == 304:  # unchanged since the cached response
+                return self._remote_version_cache
+            raise
         tag = data.get('tag_name') or data.get('name')
         download_url = None
         for asset in data.get('assets', []):
@@ -171,6 +288,7 @@ class YTDownloader:
                 break
         if not (tag and download_url):
             return None
+        self._remote_etag = etag
         return tag, download_url
 
     def _download_ytdlp(self, url: str, dest: Path) -> None:
@@ -178,26 +296,57 @@ class YTDownloader:
         req = Request(url, headers={'User-Agent': self._USER_AGENT})
         tmp_path: Optional[Path] = None
         try:
-            with urlopen(req, timeout=120) as resp:
+            with urlopen(req, timeout=120, context=self._ssl_context()) as resp:
                 with tempfile.NamedTemporaryFile(delete=False, dir=str(dest.parent), suffix='.tmp') as tmp:
-                    shutil.copyfileobj(resp, tmp)
                     tmp_path = Path(tmp.name)
+                    shutil.copyfileobj(resp, tmp, length=self._DOWNLOAD_CHUNK)
+                    # Durable before the rename so a crash can't leave a truncated yt-dlp.exe
+                    tmp.flush()
+                    os.fsync(tmp.fileno())
+            # On Windows a running yt-dlp.exe can't be replaced; leave it for the deferred retry
+            if dest.exists() and self._defer_update_if_busy():
+                raise RuntimeError("yt-dlp is in use by a running download")
             os.replace(tmp_path, dest)
             tmp_path = None
         finally:
-            if tmp_path and tmp_path.exists():
+            if tmp_path:
                 try:
-                    tmp_path.unlink()
+                    tmp_path.unlink(missing_ok=True)
                 except Exception:
                     pass
 
+    def _start_background_update(self) -> None:
+        self._update_thread = threading.Thread(target=self._background_update, name="ytdlp-update", daemon=True)
+        self._update_thread.start()
+
+    def _defer_update_if_busy(self) -> bool:
+        """Flag the update for a retry after the running download; True if one is running."""
+        with self._lock:
+            if self._is_downloading:
+                self._update_deferred = True
+            return self._is_downloading
+
+    def _background_update(self) -> None:
+        try:
+            ensured = self._ensure_latest_ytdlp()
+        except Exception:
+            return
+        if ensured and os.path.isfile(ensured):
+            self._ytdlp_path = ensured
+
     def _ensure_latest_ytdlp(self) -> Optional[str]:
+        with self._update_lock:
+            return self._update_ytdlp()
+
+    def _update_ytdlp(self) -> Optional[str]:
         target = self._target_ytdlp_path()
         if target is None:
             return None
         version_file = self._version_file_path()
         local_exists = target.is_file()
-        remote_info = self._get_remote_release_info()
+        if local_exists and time.time() < self._next_check_at(target):
+            return str(target)
+        remote_info, confirmed = self._get_remote_release_info()
         remote_version = None
         remote_url = None
         if remote_info:
@@ -209,27 +358,51 @@ class YTDownloader:
                     if remote_version and version_file:
                         norm_remote = self._normalize_version(remote_version) or remote_version
                         self._write_version_file(version_file, norm_remote)
+                    if confirmed:
+                        self._schedule_next_check()
                     return str(target)
                 except Exception:
                     if target.exists():
                         return str(target)
                     return None
             return None
-        local_version = self._get_local_version(target)
         remote_norm = self._normalize_version(remote_version)
+        local_version = self._get_local_version(target, remote_norm)
+        # Push the next check out only after a confirmed lookup that left us current
+        check_ok = confirmed
         if remote_norm and remote_url and (not local_version or remote_norm != local_version):
+            if self._defer_update_if_busy():
+                return str(target)
             try:
                 self._download_ytdlp(remote_url, target)
                 if version_file:
                     self._write_version_file(version_file, remote_norm)
                 local_version = remote_norm
             except Exception:
-                pass
-        elif local_version and version_file and not version_file.exists():
+                check_ok = False
+        elif local_version and local_version != remote_norm and version_file and not version_file.exists():
+            # A probed match was already recorded by _get_local_version; an assumed one must not be
             self._write_version_file(version_file, local_version)
+        if check_ok:
+            self._schedule_next_check()
         return str(target)
 
+    def invalidate(self) -> None:
+        """Forget the resolved executables so the next download looks them up again."""
+        self._ffmpeg_path = None
+        self._ytdlp_path = None
+        self._ffmpeg_checked_at = 0.0
+        self._ytdlp_checked_at = 0.0
+
     def _resolve_ffmpeg(self) -> Optional[str]:
+        now = time.monotonic()
+        if self._ffmpeg_path and now - self._ffmpeg_checked_at < self._RESOLVE_TTL:
+            return self._ffmpeg_path
+        path = self._find_ffmpeg()
+        self._ffmpeg_checked_at = now if path else 0.0
+        return path
+
+    def _find_ffmpeg(self) -> Optional[str]:
         if self._ffmpeg_path and os.path.isfile(self._ffmpeg_path):
             return self._ffmpeg_path
         bundled = Path(self._app_dir()) / "ffmpeg" / "bin" / "ffmpeg.exe"
@@ -243,15 +416,20 @@ class YTDownloader:
         return None
 
     def _resolve_ytdlp(self) -> Optional[str]:
+        now = time.monotonic()
+        if self._ytdlp_path and now - self._ytdlp_checked_at < self._RESOLVE_TTL:
+            return self._ytdlp_path
+        path = self._find_ytdlp()
+        self._ytdlp_checked_at = now if path else 0.0
+        return path
+
+    def _find_ytdlp(self) -> Optional[str]:
         if self._ytdlp_path and os.path.isfile(self._ytdlp_path):
             return self._ytdlp_path
-        ensured = None
-        try:
-            ensured = self._ensure_latest_ytdlp()
-        except Exception:
-            ensured = None
-        if ensured and os.path.isfile(ensured):
-            self._ytdlp_path = ensured
+        # Use whatever is already on disk; updates happen in the background thread
+        target = self._target_ytdlp_path()
+        if target and target.is_file():
+            self._ytdlp_path = str(target)
             return self._ytdlp_path
         bundled = Path(self._app_dir()) / "yt-dlp.exe"
         if bundled.is_file():
@@ -261,8 +439,37 @@ class YTDownloader:
         if found:
             self._ytdlp_path = found
             return self._ytdlp_path
+        # Nothing available yet: block on the download (joins a running background update via the lock)
+        ensured = None
+        try:
+            ensured = self._ensure_latest_ytdlp()
+        except Exception:
+            ensured = None
+        if ensured and os.path.isfile(ensured):
+            self._ytdlp_path = ensured
+            return self._ytdlp_path
         return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _build_cmd_template(ytdlp_path: str, ffmpeg_path: Optional[str], target_sr_int: int) -> tuple[str, ...]:
+        """The URL-independent part of the yt-dlp command line."""
+        cmd = [
+            ytdlp_path,
+            "-f",
+            "bestaudio/best",
+            "--no-playlist",
+            "--newline",  # one progress line per update instead of CR rewrites
+            "--extract-audio",
+            "--audio-format",
+            "wav",
+            "--postprocessor-args",
+            f"-ar {target_sr_int} -ac 2",
+        ]
+        if ffmpeg_path:
+            cmd.extend(["--ffmpeg-location", ffmpeg_path])
+        return tuple(cmd)
+
     def download_best_audio_to_wav(
         self,
         url: str,
@@ -272,10 +479,13 @@ class YTDownloader:
         on_log: Optional[Callable[[str], None]] = None,
     ) -> str:
         """Download a YouTube URL as a stereo WAV file and return the path."""
-        ytdlp_path = self._resolve_ytdlp()
+        # Independent lookups; a first-run yt-dlp fetch shouldn't serialize the ffmpeg PATH walk
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            ffmpeg_future = pool.submit(self._resolve_ffmpeg)
+            ytdlp_path = self._resolve_ytdlp()
+            ffmpeg_path = ffmpeg_future.result()
         if not ytdlp_path:
             raise DependencyError("ytdlp", "yt-dlp executable not found")
-        ffmpeg_path = self._resolve_ffmpeg()
         if not ffmpeg_path:
             raise DependencyError("ffmpeg", "ffmpeg executable not found")
 
@@ -289,31 +499,12 @@ class YTDownloader:
         os.makedirs(out_dir, exist_ok=True)
         output_template = str(Path(out_dir) / "%(title)s [%(id)s].%(ext)s")
 
-        cmd = [
-            ytdlp_path,
-            "-f",
-            "bestaudio/best",
-            "--no-playlist",
-            "--extract-audio",
-            "--audio-format",
-            "wav",
-            "--postprocessor-args",
-            f"-ar {target_sr_int} -ac 2",
-            "--output",
-            output_template,
-            url,
-        ]
+        cmd = [*self._build_cmd_template(ytdlp_path, ffmpeg_path, target_sr_int), "--output", output_template, url]
 
-        if ffmpeg_path:
-            ffmpeg_arg = ffmpeg_path if ffmpeg_path.lower().endswith("ffmpeg.exe") else ffmpeg_path
-            cmd.extend(["--ffmpeg-location", ffmpeg_arg])
-
-        temp_patterns = ('*.part', '*.tmp')
-        before_temp = {p.name for pattern in temp_patterns for p in Path(out_dir).glob(pattern)}
+        before_temp = self._list_temp(out_dir)
 
-        progress_regex = re.compile(r"(\d+(?:\.\d+)?)%")
         final_path: Optional[str] = None
-        log_lines: list[str] = []
+        log_lines: deque[bytes] = deque(maxlen=5)  # only the tail is reported on failure
         process: Optional[subprocess.Popen] = None
         success = False
 
@@ -330,9 +521,6 @@ class YTDownloader:
             popen_kwargs = dict(
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
             )
             if os.name == 'nt':
                 startupinfo = subprocess.STARTUPINFO()
@@ -345,28 +533,34 @@ class YTDownloader:
                 create_no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0)
                 if create_no_window:
                     popen_kwargs["creationflags"] = create_no_window
-            process = subprocess.Popen(cmd, **popen_kwargs)
+            try:
+                process = subprocess.Popen(cmd, **popen_kwargs)
+            except OSError:
+                # A cached executable vanished or broke; look it up again next time
+                self.invalidate()
+                raise
 
             with self._lock:
                 self._process = process
 
             assert process.stdout is not None
-            for raw_line in process.stdout:
+            for raw_line in self._iter_output_lines(process.stdout):
                 line = raw_line.strip()
                 log_lines.append(line)
                 if on_log and line:
-                    on_log(line)
-                match = progress_regex.search(line)
-                if match and on_progress:
+                    on_log(line.decode("utf-8", "replace"))
+                match = self._PROGRESS_RE.search(line) if on_progress and b"%" in line else None
+                if match:
                     try:
                         pct = float(match.group(1))
                         on_progress(max(0, min(100, int(pct))))
                     except Exception:
                         pass
-                if "Destination:" in line:
-                    possible = line.split("Destination:", 1)[1].strip().strip('"')
+                if line.startswith(b"["):
+                    _, mark, after = line.partition(self._DEST_MARK)
+                    possible = after.strip().strip(b'"') if mark else None
                     if possible:
-                        final_path = possible
+                        final_path = possible.decode("utf-8", "replace")
 
             return_code = process.wait()
             if process.stdout:
@@ -376,7 +570,7 @@ class YTDownloader:
                 raise DownloadCanceled("cancelled")
 
             if return_code != 0:
-                tail = "\n".join(log_lines[-5:]) if log_lines else ""
+                tail = "\n".join(l.decode("utf-8", "replace") for l in log_lines)
                 raise RuntimeError(f"yt-dlp failed: {tail}")
 
             if on_progress:
@@ -402,40 +596,73 @@ class YTDownloader:
                 self._process = None
                 self._is_downloading = False
                 self._cancel_requested = False
+                retry_update = self._update_deferred
+                self._update_deferred = False
             if proc and proc.poll() is None:
                 try:
                     proc.terminate()
-                    proc.wait(timeout=2.0)
+                    proc.wait(timeout=1.0)
                 except Exception:
                     try:
                         proc.kill()
+                        proc.wait(timeout=1.0)
                     except Exception:
                         pass
+            # Only once yt-dlp has exited, so the deferred update can replace the exe
+            if retry_update:
+                self._start_background_update()
             if not success:
-                for pattern in temp_patterns:
-                    for temp_file in Path(out_dir).glob(pattern):
-                        if temp_file.name not in before_temp:
-                            try:
-                                temp_file.unlink()
-                            except Exception:
-                                pass
+                for name in self._list_temp(out_dir) - before_temp:
+                    try:
+                        os.remove(os.path.join(out_dir, name))
+                    except Exception:
+                        pass
                 if final_path and os.path.isfile(final_path):
                     try:
                         os.remove(final_path)
                     except Exception:
                         pass
 
+    def _iter_output_lines(self, stream) -> Iterator[bytes]:
+        """Yield byte lines split on CR or LF, reading the pipe in large chunks."""
+        if os.name == 'nt':
+            read = stream.read1
+        else:
+            fd = stream.fileno()
+            read = lambda n: os.read(fd, n)  # raw fd: skip the BufferedReader layer
+        buf = b""
+        while True:
+            chunk = read(65536)
+            if not chunk:
+                break
+            buf += chunk
+            start = 0
+            for m in self._EOL_RE.finditer(buf):
+                yield buf[start:m.end()]
+                start = m.end()
+            buf = buf[start:]
+        if buf:
+            yield buf
+
+    def _list_temp(self, folder: str) -> set[str]:
+        """Names of yt-dlp partial/temporary files in `folder` (one directory pass)."""
+        try:
+            with os.scandir(folder) as it:
+                return {e.name for e in it if e.name.endswith(('.part', '.tmp'))}
+        except OSError:
+            return set()
+
     def _find_latest_wav(self, folder: str) -> Optional[str]:
+        # Single pass over DirEntry objects (stat is cached from the directory read on Windows)
+        best: Optional[tuple[float, str]] = None
         try:
-            wav_files = [
-                Path(folder) / entry
-                for entry in os.listdir(folder)
-                if entry.lower().endswith('.wav')
-            ]
+            with os.scandir(folder) as it:
+                for entry in it:
+                    if entry.name[-4:].lower() == '.wav' and entry.is_file():  # lowercase the suffix only
+                        mtime = entry.stat().st_mtime
+                        if best is None or mtime > best[0]:
+                            best = (mtime, entry.path)
         except Exception:
             return None
-        if not wav_files:
-            return None
-        wav_files.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-        return str(wav_files[0])
+        return best[1] if best else None
 